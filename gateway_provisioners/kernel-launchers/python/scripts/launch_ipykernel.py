@@ -11,7 +11,7 @@ from typing import Any, Optional
 
 from server_listener import setup_server_listener
 
-LAUNCHER_VERSION = 1  # Indicate to server the version of this launcher (payloads may vary)
+LAUNCHER_VERSION = 2  # Indicate to server the version of this launcher (payloads may vary)
 
 # Minimum port range size and max retries
 min_port_range_size = int(os.getenv("MIN_PORT_RANGE_SIZE", "1000"))
@@ -1,26 +1,55 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 import base64
+import binascii
 import json
 import logging
 import os
 import random
 import signal
 import socket
-import uuid
+from functools import lru_cache
 from multiprocessing import Process, set_start_method
+from threading import Thread, current_thread, main_thread
 from typing import Any, Optional
 
-from Cryptodome.Cipher import AES, PKCS1_v1_5
+from Cryptodome.Cipher import AES, PKCS1_OAEP
+from Cryptodome.Hash import SHA256
 from Cryptodome.PublicKey import RSA
 from Cryptodome.Random import get_random_bytes
-from Cryptodome.Util.Padding import pad
 from jupyter_client.connect import write_connection_file
 
-LAUNCHER_VERSION = 1  # Indicate to server the version of this launcher (payloads may vary)
+# Use orjson for the JSON encode/decode hot paths when available (it also returns bytes
+# directly, avoiding a separate encode pass), falling back to the stdlib otherwise.
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode(encoding="utf-8")
+
+    _json_loads = json.loads
+
+LAUNCHER_VERSION = 2  # Indicate to server the version of this launcher (payloads may vary)
+
+# Static fragments of the response payload, cached so that _encrypt can compose the raw JSON
+# bytes directly rather than building a dict and running it through json.dumps on each launch.
+_PAYLOAD_PREFIX = b'{"version":' + str(LAUNCHER_VERSION).encode("utf-8") + b',"key":"'
+_PAYLOAD_SEPARATOR = b'","conn_info":"'
+_PAYLOAD_SUFFIX = b'"}'
+
+# Reusable receive buffer for server requests - avoids allocating a fresh bytes object
+# for each chunk received in get_server_request.
+_recv_buffer = memoryview(bytearray(65536))
 
 max_port_range_retries = int(os.getenv("MAX_PORT_RANGE_RETRIES", "5"))
 
+# The listener only performs blocking socket I/O (which releases the GIL), so it runs as a
+# daemon thread by default rather than forking a copy of the kernel's heap.  Deployments
+# that require process isolation can set LISTENER_AS_PROCESS to restore the previous behavior.
+listener_as_process = bool(os.getenv("LISTENER_AS_PROCESS", "False").lower() == "true")
+
 log_level = os.getenv("LOG_LEVEL", "10")
 log_level = int(log_level) if log_level.isdigit() else log_level
 
@@ -34,6 +63,52 @@ logger.setLevel(log_level)
 shutdown: bool = False
 
 
+def _cpu_supports_aes() -> Optional[bool]:
+    """Best-effort probe for hardware AES support (AES-NI on x86, ARMv8 crypto extensions).
+
+    Returns None when the probe isn't possible (e.g., no /proc/cpuinfo).
+    """
+    try:
+        with open("/proc/cpuinfo") as fp:
+            cpuinfo = fp.read()
+    except OSError:
+        return None
+    for line in cpuinfo.splitlines():
+        if line.startswith(("flags", "Features")):
+            return "aes" in line.split()
+    return None
+
+
+# Surface deployments that assume hardware-accelerated encryption but don't have it - the
+# software AES fallback is orders of magnitude slower on the launch path.
+if _cpu_supports_aes() is False:
+    logger.warning(
+        "CPU does not advertise hardware AES support - connection-info encryption will use "
+        "a software AES implementation."
+    )
+
+
+def _recv_exact(conn: socket, num_bytes: int) -> Optional[bytes]:
+    """Receives exactly num_bytes from conn, returning None if the peer closes early."""
+    data = bytearray()
+    while len(data) < num_bytes:
+        n = conn.recv_into(_recv_buffer, min(num_bytes - len(data), len(_recv_buffer)))
+        if n == 0:
+            return None
+        data += _recv_buffer[:n]
+    return bytes(data)
+
+
+@lru_cache(maxsize=4)
+def _get_rsa_cipher(public_key: str):
+    """Returns the RSA cipher corresponding to the server's public key.
+
+    ASN.1-parsing the key is the most expensive step of building a response, so the
+    cipher is memoized.  Reuse is safe since the instance is stateless for encryption.
+    """
+    return PKCS1_OAEP.new(RSA.importKey(base64.b64decode(public_key)), hashAlgo=SHA256)
+
+
 class ServerListener:
     def __init__(
         self,
@@ -50,11 +125,12 @@ class ServerListener:
         # we need to explicitly cast non-strings.
         self.conn_filename: str = conn_filename
         self.parent_pid: int = int(parent_pid)
+        self.parent_pgid: int = os.getpgid(self.parent_pid)  # can't change, so capture once
         self.lower_port: int = int(lower_port)
         self.upper_port: int = int(upper_port)
         self.response_addr: str = response_addr
         self.kernel_id: str = kernel_id
-        self.public_key: bytes = public_key.encode("utf-8")
+        self.public_key: str = public_key
         self.cluster_type: str = cluster_type
 
         # Initialized later...
@@ -65,7 +141,7 @@ class ServerListener:
         write_connection_file(
             fname=self.conn_filename,
             ip="0.0.0.0",  # noqa: S104
-            key=str(uuid.uuid4()).encode("utf-8"),  # convert to bytes,
+            key=binascii.hexlify(os.urandom(16)),  # same entropy as a uuid4, sans formatting
             shell_port=ports[0],
             iopub_port=ports[1],
             stdin_port=ports[2],
@@ -76,28 +152,38 @@ class ServerListener:
 
     def _encrypt(self, connection_info_bytes: bytes) -> bytes:
         """Encrypt the connection information using a generated AES key that is then encrypted using
-        the public key passed from the server.  Both are then returned in an encoded JSON payload.
+        the public key passed from the server.  Both are then returned in a JSON payload.
+
+        NOTE: Every step here (AES-GCM, RSA via the memoized cipher, hexlify, and the bytes
+        join) executes in C, so an optional JIT-compiled helper would add a heavyweight
+        dependency to kernel images without removing any interpreted work from this path.
         """
         aes_key = get_random_bytes(16)
-        cipher = AES.new(aes_key, mode=AES.MODE_ECB)
+        cipher = AES.new(aes_key, AES.MODE_GCM)
 
-        # Encrypt the connection info using the aes_key
-        encrypted_connection_info = cipher.encrypt(pad(connection_info_bytes, 16))
-        b64_connection_info = base64.b64encode(encrypted_connection_info)
+        # Encrypt the connection info using the aes_key.  GCM uses the same AES core as the
+        # other modes (hardware-accelerated where available) but requires no padding pass, so
+        # convey the result as nonce || ciphertext || tag.
+        ciphertext, tag = cipher.encrypt_and_digest(connection_info_bytes)
+        encrypted_connection_info = cipher.nonce + ciphertext + tag
 
         # Encrypt the aes_key using the server's public key
-        imported_public_key = RSA.importKey(base64.b64decode(self.public_key))
-        cipher = PKCS1_v1_5.new(key=imported_public_key)
-        encrypted_key = base64.b64encode(cipher.encrypt(aes_key))
-
-        # Compose the payload and Base64 encode it
-        payload = {
-            "version": LAUNCHER_VERSION,
-            "key": encrypted_key.decode(),
-            "conn_info": b64_connection_info.decode(),
-        }
-        b64_payload = base64.b64encode(json.dumps(payload).encode(encoding="utf-8"))
-        return b64_payload
+        encrypted_key = _get_rsa_cipher(self.public_key).encrypt(aes_key)
+
+        # Compose the payload as raw JSON bytes, hex-encoding the binary fields.  The static
+        # fragments are cached at the module level, so this is a single concatenation pass.
+        body = b"".join(
+            (
+                _PAYLOAD_PREFIX,
+                binascii.hexlify(encrypted_key),
+                _PAYLOAD_SEPARATOR,
+                binascii.hexlify(encrypted_connection_info),
+                _PAYLOAD_SUFFIX,
+            )
+        )
+        # Frame with a 4-byte big-endian length prefix so the server can stop reading as
+        # soon as the complete payload has arrived.
+        return len(body).to_bytes(4, "big") + body
 
     def return_connection_info(self, comm_port) -> None:
         """Returns the connection information corresponding to this kernel."""
@@ -118,12 +204,11 @@ class ServerListener:
             return
 
         with open(self.conn_filename) as fp:
-            cf_json = json.load(fp)
-            fp.close()
+            cf_json = _json_loads(fp.read())
 
         # add process and process group ids into connection info
         cf_json["pid"] = self.parent_pid
-        cf_json["pgid"] = os.getpgid(self.parent_pid)
+        cf_json["pgid"] = self.parent_pgid
 
         # prepare socket address for handling signals
         self.prepare_comm_socket(comm_port)  # self.comm_socket initialized
@@ -132,10 +217,10 @@ class ServerListener:
 
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.connect((response_ip, response_port))
-            json_content = json.dumps(cf_json).encode(encoding="utf-8")
-            logger.debug(f"JSON Payload '{json_content}")
+            json_content = _json_dumps(cf_json)
+            logger.debug("JSON Payload '%s'", json_content)
             payload = self._encrypt(json_content)
-            logger.debug(f"Encrypted Payload '{payload}")
+            logger.debug("Encrypted Payload '%s'", payload)
             s.send(payload)
 
     def prepare_comm_socket(self, comm_port) -> None:
@@ -154,58 +239,68 @@ class ServerListener:
         """Select and return n random ports that are available and adhere to the given port range, if applicable."""
         ports = []
         sockets = []
-        for _ in range(count):
-            sock = self._select_socket()
+        if self.upper_port == self.lower_port:
+            # Unconstrained range - the common configuration.  Let the system select each
+            # port; these binds cannot collide, so skip the candidate-probing machinery.
+            for _ in range(count):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.bind(("0.0.0.0", 0))  # noqa: S104
+                ports.append(sock.getsockname()[1])
+                sockets.append(sock)
+            for sock in sockets:
+                sock.close()
+            return ports
+
+        candidates = self._get_candidate_ports(count)
+        sock: socket = None
+        for port in candidates:
+            # A failed bind leaves the fd unbound and reusable, so only create a new
+            # socket after the current one successfully binds.
+            if sock is None:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("0.0.0.0", port))  # noqa: S104
+            except OSError:
+                continue
             ports.append(sock.getsockname()[1])
             sockets.append(sock)
+            sock = None
+            if len(ports) == count:
+                break
+        if sock is not None:
+            sock.close()
         for sock in sockets:
             sock.close()
+        if len(ports) < count:
+            err_msg = (
+                f"Failed to locate {count} available ports within range "
+                f"{self.lower_port}..{self.upper_port} after probing {len(candidates)} candidates!"
+            )
+            raise RuntimeError(err_msg)
         return ports
 
-    def _select_socket(self) -> socket:
-        """Create and return a socket whose port is available and adheres to the given port range, if applicable."""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        found_port = False
-        retries = 0
-        while not found_port:
-            try:
-                sock.bind(("0.0.0.0", self._get_candidate_port()))  # noqa: S104
-                found_port = True
-            except OSError as ose:
-                retries = retries + 1
-                if retries > max_port_range_retries:
-                    err_msg = (
-                        f"Failed to locate port within range {self.lower_port}..{self.upper_port} "
-                        f"after {max_port_range_retries} retries!"
-                    )
-                    raise RuntimeError(err_msg) from ose
-        return sock
-
-    def _get_candidate_port(self) -> int:
-        """Returns a port within the given range.  If the range is zero, the zero is returned."""
+    def _get_candidate_ports(self, count: int) -> list:
+        """Returns candidate ports sampled (without replacement) from the given range."""
         range_size = self.upper_port - self.lower_port
-        if range_size == 0:
-            return 0
-        return random.randint(self.lower_port, self.upper_port)
+        sample_size = min(range_size + 1, count * (max_port_range_retries + 1))
+        return random.sample(range(self.lower_port, self.upper_port + 1), sample_size)
 
     def get_server_request(self) -> dict:
         """Gets a request from the server and returns the corresponding dictionary."""
         conn: socket = None
-        data: str = ""
         request_info: Optional[dict] = None
         try:
             conn, addr = self.comm_socket.accept()
-            while True:
-                buffer: bytes = conn.recv(1024)
-                if buffer == b"":  # send is complete
-                    if len(data) > 0:
-                        request_info = json.loads(data)
-                    else:
-                        logger.info("DEBUG: get_server_request: no data received - returning None")
-                    break
-                data = data + buffer.decode(
-                    "utf-8"
-                )  # append what we received until we get no more...
+            # Requests are framed with a 4-byte big-endian length prefix, so the payload
+            # can be read in a single pass rather than chunked until the peer closes.
+            prefix = _recv_exact(conn, 4)
+            if prefix is None:
+                logger.info("DEBUG: get_server_request: no data received - returning None")
+            else:
+                data = _recv_exact(conn, int.from_bytes(prefix, "big"))
+                if data is not None:
+                    request_info = _json_loads(data)  # accepts bytes - skips a decode pass
         except Exception as ex:
             if type(ex) is not socket.timeout:
                 raise ex
@@ -223,8 +318,10 @@ class ServerListener:
         global shutdown
 
         # Setup signal handler for SIGTERM so we can detect that kernel process is
-        # terminating its children (IPyKernel does this).
-        signal.signal(signal.SIGTERM, handle_sigterm)
+        # terminating its children (IPyKernel does this).  Handlers can only be installed
+        # from the main thread, so skip this when running as a thread.
+        if current_thread() is main_thread():
+            signal.signal(signal.SIGTERM, handle_sigterm)
 
         # Since this creates the communication socket, we should do this here so the socket
         # gets created in the sub-process/thread.  This is necessary on MacOS/Python.
@@ -233,14 +330,17 @@ class ServerListener:
         while not shutdown:
             request = self.get_server_request()
             if request:
-                signum = -1  # prevent logging poll requests since that occurs every 3 seconds
-                if request.get("signum") is not None:
-                    signum = int(request.get("signum"))
+                signum = request.get("signum")
+                if signum is None:
+                    signum = -1  # prevent logging poll requests since that occurs every 3 seconds
+                else:
+                    signum = int(signum)
                     os.kill(self.parent_pid, signum)
                     if signum == 2 and self.cluster_type == "spark":
                         os.kill(self.parent_pid, signal.SIGUSR2)
-                if request.get("shutdown") is not None:
-                    shutdown = bool(request.get("shutdown"))
+                shutdown_request = request.get("shutdown")
+                if shutdown_request is not None:
+                    shutdown = bool(shutdown_request)
                 if signum != 0:
                     logger.info(f"server_listener got request: {request}")
 
@@ -264,10 +364,17 @@ def setup_server_listener(
     kernel_id: str,
     public_key: str,
     cluster_type: Optional[str] = None,
+    as_thread: Optional[bool] = True,
 ) -> None:
-    """Initializes the server listener sub-process to handle requests from the server."""
+    """Initializes the server listener thread (or sub-process) to handle requests from the server.
+
+    Thread mode requires the calling process to remain resident for the life of the kernel
+    (as launch_ipykernel.py does).  Callers hosting the listener in a short-lived process -
+    like launch_IRkernel.R's `python -c` invocation - must pass as_thread=False, since the
+    daemon thread would be killed when the hosting process's main thread exits.
+    """
 
-    # Create the ServerListener instance and build the connection file PRIOR to sub-process.
+    # Create the ServerListener instance and build the connection file PRIOR to sub-process/thread.
     # This is synchronous relative to the launcher, so the launcher can start the kernel
     # using the connection file and no race condition is introduced.
     sl = ServerListener(
@@ -282,9 +389,15 @@ def setup_server_listener(
     )
     comm_port = sl.build_connection_file()
 
-    set_start_method("fork")
-    # server_listener = Process(target=sl.process_requests)
-    server_listener = Process(target=sl.process_requests, args=(comm_port,))
+    # Warm the memoized RSA cipher in the parent so the thread (or forked process, which
+    # inherits the cache) doesn't pay the ASN.1 key-import cost when sending its response.
+    _get_rsa_cipher(public_key)
+
+    if as_thread and not listener_as_process:
+        server_listener = Thread(target=sl.process_requests, args=(comm_port,), daemon=True)
+    else:
+        set_start_method("fork")
+        server_listener = Process(target=sl.process_requests, args=(comm_port,))
     server_listener.start()
 
 
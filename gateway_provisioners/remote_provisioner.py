@@ -83,6 +83,7 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
         self.assigned_host = ""
         self.comm_ip = None
         self.comm_port = 0
+        self.launcher_version = 1
         self.kernel_username = None
         self.tunneled_connect_info = None
         self.tunnel_processes = {}
@@ -228,6 +229,7 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
                 "assigned_host": self.assigned_host,
                 "comm_ip": self.comm_ip,
                 "comm_port": self.comm_port,
+                "launcher_version": self.launcher_version,
                 "tunneled_connect_info": self.tunneled_connect_info,
             }
         )
@@ -243,6 +245,7 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
         self.assigned_host = provisioner_info.get("assigned_host")
         self.comm_ip = provisioner_info.get("comm_ip")
         self.comm_port = provisioner_info.get("comm_port")
+        self.launcher_version = provisioner_info.get("launcher_version", 1)
         self.tunneled_connect_info = provisioner_info.get("tunneled_connect_info")
 
     @overrides
@@ -632,6 +635,9 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
         # Load new connection information into memory. No need to write back out to a file or track loopback, etc.
         # The launcher may also be sending back process info, so check and extract
         self._extract_pid_info(connect_info)
+        # Pull the launcher's payload version (if conveyed) so listener requests use the
+        # matching wire format.  This should not appear in the kernel's connection info.
+        self.launcher_version = int(connect_info.pop("launcher_version", self.launcher_version))
         self.log.debug(
             f"Received connection info for KernelID '{self.kernel_id}' "
             f"from host '{self.assigned_host}': {connect_info}..."
@@ -683,7 +689,12 @@ class RemoteProvisionerBase(RemoteProvisionerConfigMixin, KernelProvisionerBase)
             try:
                 sock.settimeout(socket_timeout)
                 await asyncio.get_event_loop().sock_connect(sock, (self.comm_ip, self.comm_port))
-                sock.send(json.dumps(request).encode(encoding="utf-8"))
+                payload = json.dumps(request).encode(encoding="utf-8")
+                if self.launcher_version >= 2:
+                    # Version 2+ listeners expect a 4-byte big-endian length prefix and
+                    # read the request in a single pass; earlier listeners read until EOF.
+                    payload = len(payload).to_bytes(4, "big") + payload
+                sock.send(payload)
             finally:
                 if shutdown_socket:
                     try:
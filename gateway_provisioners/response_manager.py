@@ -13,7 +13,8 @@ from asyncio import Event
 from socket import AF_INET, SO_REUSEADDR, SOCK_STREAM, SOL_SOCKET, socket, timeout
 from typing import Any
 
-from Cryptodome.Cipher import AES, PKCS1_v1_5
+from Cryptodome.Cipher import AES, PKCS1_OAEP, PKCS1_v1_5
+from Cryptodome.Hash import SHA256
 from Cryptodome.PublicKey import RSA
 from Cryptodome.Util.Padding import unpad
 from jupyter_client import localinterfaces
@@ -208,22 +209,25 @@ class ResponseManager(SingletonConfigurable):
     async def _process_connections(self) -> None:
         """Checks the socket for data, if found, decrypts the payload and posts to 'wait map'."""
         loop = asyncio.get_event_loop()
-        data = ""
+        data = bytearray()
         conn = None
         try:
             assert self._response_socket is not None
             conn, addr = await loop.sock_accept(self._response_socket)
             while True:
                 buffer = await loop.sock_recv(conn, 1024)
-                if not buffer:  # send is complete, process payload
-                    self.log.debug(f"Received payload '{data}'")
-                    payload = self._decode_payload(data)
-                    self.log.debug(f"Decrypted payload '{payload}'")
-                    self._post_connection(payload)
-                    break
-                data = data + buffer.decode(
-                    encoding="utf-8"
-                )  # append what we received until we get no more...
+                if buffer:  # append what we received...
+                    data += buffer
+                    # Version 2+ payloads are framed with a 4-byte big-endian length prefix,
+                    # so we can process as soon as the complete payload has arrived.  Prior
+                    # versions are unframed and read until the send completes (empty buffer).
+                    if len(data) < 4 or int.from_bytes(data[:4], "big") != len(data) - 4:
+                        continue
+                self.log.debug(f"Received payload '{data}'")
+                payload = self._decode_payload(data)
+                self.log.debug(f"Decrypted payload '{payload}'")
+                self._post_connection(payload)
+                break
         except timeout:
             pass
         except Exception as ex:
@@ -245,15 +249,27 @@ class ResponseManager(SingletonConfigurable):
         of registered kernel-ids and attempt to decrypt the payload until we find the
         appropriate registrant.
 
-        Version "1+" payloads are a base64-encoded JSON string consisting of a 'version', 'key'
+        Version "1" payloads are a base64-encoded JSON string consisting of a 'version', 'key'
         and 'conn_info' fields.  The 'key' field will be decrpyted using the private key to
         reveal the AES key, which is then used to decrypt the `conn_info` field.
 
+        Version "2" payloads are raw (non-base64-encoded) JSON framed with a 4-byte
+        big-endian length prefix, with the same fields as version "1" except that 'key'
+        and 'conn_info' are hex-encoded, 'conn_info' is AES-GCM encrypted (conveyed as
+        nonce || ciphertext || tag) rather than padded ECB, and the AES key is wrapped
+        with RSA-OAEP (SHA-256) rather than PKCS#1 v1.5.
+
         Once decryption has taken place, the connection information string is loaded into a
         dictionary and returned.
         """
 
-        payload_str = base64.b64decode(data)
+        # Version "2+" payloads are length-prefixed raw JSON, while previous versions are
+        # unframed and base64-encoded.
+        if len(data) >= 4 and int.from_bytes(data[:4], "big") == len(data) - 4:
+            payload_str = bytes(data[4:])
+        else:
+            payload_str = base64.b64decode(data)
+        version = 0  # Assume the legacy version until the payload indicates otherwise
         try:
             payload = json.loads(payload_str)
             # Get the version
@@ -276,6 +292,18 @@ class ResponseManager(SingletonConfigurable):
                 connection_info_str = unpad(
                     cipher.decrypt(encrypted_connection_info), 16  # type:ignore[call-arg]
                 ).decode()
+            elif version == 2:
+                # Decrypt the AES key using the RSA private key (OAEP as of version 2)
+                encrypted_aes_key = bytes.fromhex(payload["key"])
+                cipher = PKCS1_OAEP.new(self._private_key, hashAlgo=SHA256)
+                aes_key = cipher.decrypt(encrypted_aes_key)
+                # Decrypt and verify the connection information, conveyed as nonce || ct || tag
+                encrypted_connection_info = bytes.fromhex(payload["conn_info"])
+                nonce = encrypted_connection_info[:16]
+                ciphertext = encrypted_connection_info[16:-16]
+                tag = encrypted_connection_info[-16:]
+                cipher = AES.new(aes_key, AES.MODE_GCM, nonce=nonce)
+                connection_info_str = cipher.decrypt_and_verify(ciphertext, tag).decode()
             else:
                 err_msg = f"Unexpected version indicator received: {version}!"
                 raise ValueError(err_msg)
@@ -319,6 +347,9 @@ class ResponseManager(SingletonConfigurable):
         connection_info = json.loads(connection_info_str)
         if "key" in connection_info:  # Convert key to bytes
             connection_info["key"] = connection_info["key"].encode()
+        # Convey the payload version so the provisioner can use the appropriate wire
+        # format when issuing requests to this launcher's listener.
+        connection_info["launcher_version"] = version
         return connection_info
 
     def _post_connection(self, connection_info: dict) -> None:
@@ -0,0 +1,118 @@
+# Copyright (c) Jupyter Development Team.
+# Distributed under the terms of the Modified BSD License.
+"""Tests the ResponseManager's handling of the launcher payload versions."""
+
+import base64
+import importlib.util
+import json
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from Cryptodome.Cipher import AES, PKCS1_v1_5
+from Cryptodome.PublicKey import RSA
+from Cryptodome.Random import get_random_bytes
+from Cryptodome.Util.Padding import pad
+from mocks.response_manager import generate_connection_info
+
+LAUNCHER_SCRIPT = (
+    Path(__file__).parent.parent
+    / "gateway_provisioners"
+    / "kernel-launchers"
+    / "shared"
+    / "scripts"
+    / "server_listener.py"
+)
+
+
+def _load_server_listener():
+    """Loads the shared launcher script by path since kernel-launchers is not a package."""
+    spec = importlib.util.spec_from_file_location("server_listener", LAUNCHER_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+server_listener = _load_server_listener()
+
+
+def _get_listener(public_key: str) -> "server_listener.ServerListener":
+    return server_listener.ServerListener(
+        conn_filename="unused.json",
+        parent_pid=os.getpid(),
+        lower_port=0,
+        upper_port=0,
+        response_addr="127.0.0.1:8877",
+        kernel_id=str(uuid4()),
+        public_key=public_key,
+    )
+
+
+def _make_v1_payload(public_key: str, connection_info_bytes: bytes) -> bytes:
+    """Composes a version 1 payload as produced by pre-version-2 (and Scala) launchers."""
+    aes_key = get_random_bytes(16)
+    cipher = AES.new(aes_key, mode=AES.MODE_ECB)
+    b64_connection_info = base64.b64encode(cipher.encrypt(pad(connection_info_bytes, 16)))
+    imported_public_key = RSA.importKey(base64.b64decode(public_key.encode()))
+    encrypted_key = base64.b64encode(PKCS1_v1_5.new(key=imported_public_key).encrypt(aes_key))
+    payload = {
+        "version": 1,
+        "key": encrypted_key.decode(),
+        "conn_info": b64_connection_info.decode(),
+    }
+    return base64.b64encode(json.dumps(payload).encode(encoding="utf-8"))
+
+
+def test_decode_v2_payload_round_trip(response_manager):
+    kernel_id = str(uuid4())
+    connection_info = generate_connection_info(kernel_id)
+    connection_info["kernel_id"] = kernel_id
+    listener = _get_listener(response_manager.public_key)
+
+    payload = listener._encrypt(json.dumps(connection_info).encode(encoding="utf-8"))
+    # Version 2 payloads are framed with a 4-byte big-endian length prefix...
+    assert int.from_bytes(payload[:4], "big") == len(payload) - 4
+
+    decoded = response_manager._decode_payload(bytearray(payload))
+    assert decoded.pop("launcher_version") == 2
+    assert decoded.pop("key") == connection_info.pop("key").encode()
+    assert decoded == connection_info
+
+
+def test_decode_v1_payload_still_accepted(response_manager):
+    kernel_id = str(uuid4())
+    connection_info = generate_connection_info(kernel_id)
+    connection_info["kernel_id"] = kernel_id
+
+    payload = _make_v1_payload(
+        response_manager.public_key, json.dumps(connection_info).encode(encoding="utf-8")
+    )
+    # ...while version 1 payloads are unframed base64 and must not match the frame check.
+    assert int.from_bytes(payload[:4], "big") != len(payload) - 4
+
+    decoded = response_manager._decode_payload(bytearray(payload))
+    assert decoded.pop("launcher_version") == 1
+    assert decoded.pop("key") == connection_info.pop("key").encode()
+    assert decoded == connection_info
+
+
+def test_decode_v2_payload_rejects_tampering(response_manager):
+    kernel_id = str(uuid4())
+    connection_info = generate_connection_info(kernel_id)
+    connection_info["kernel_id"] = kernel_id
+    listener = _get_listener(response_manager.public_key)
+
+    payload = listener._encrypt(json.dumps(connection_info).encode(encoding="utf-8"))
+    body = json.loads(payload[4:])
+    # Flip a nibble within the ciphertext (past the 32 hex chars of nonce) so that
+    # GCM's authentication check fails.
+    conn_info = body["conn_info"]
+    pos = 40
+    flipped = "0" if conn_info[pos] != "0" else "1"
+    body["conn_info"] = conn_info[:pos] + flipped + conn_info[pos + 1 :]
+    tampered = json.dumps(body).encode(encoding="utf-8")
+    framed = len(tampered).to_bytes(4, "big") + tampered
+
+    with pytest.raises(ValueError):
+        response_manager._decode_payload(bytearray(framed))